@@ -14,39 +14,80 @@ Realism:
  - ~2% missing customer contact fields
  - ~1% duplicate customer names/emails
 Data types: nominal, ordinal, interval (dates), ratio (price/quantity)
+
+Only uses PyPy-compatible packages (sqlite3, random, datetime, numpy, faker), so it can
+also be run as `pypy3 24091865_Sri_lekha.py`.
 """
 
 import sqlite3
 import random
+import numpy as np
 from faker import Faker
-from datetime import datetime, timedelta
+from datetime import date
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
 
 #  Config & Setup 
-fake = Faker()
 Faker_seed = 100
-Faker.seed(Faker_seed)
-random.seed(Faker_seed)
+
+# Each generator runs in its own thread with its own seeded random/NumPy/Faker state
+# (derived from Faker_seed), so the output does not depend on thread scheduling
+def make_rngs(offset):
+    return random.Random(Faker_seed + offset), np.random.default_rng(Faker_seed + offset)
+
+def make_fake(offset):
+    # Only the providers used below: person (name) and lorem (word)
+    fake = Faker(providers=["faker.providers.person", "faker.providers.lorem"])
+    fake.seed_instance(Faker_seed + offset)
+    return fake
 
 
 # Helper date functions
-def rand_date(start_year=2021, end_year=2024):
-    start = datetime(start_year, 1, 1)
-    end = datetime(end_year, 12, 31)
-    delta = (end - start).days
-    return (start + timedelta(days=random.randint(0, delta))).date().isoformat()
-
-def rand_order_date():
-    return rand_date(2021, 2024)
-
-def rand_shipment_date(order_date_iso):
-    # shipment 0-10 days after order, sometimes delayed (up to 20 days), sometimes missing
-    if order_date_iso is None:
+# Dates are generated as day ordinals and only formatted to ISO strings for storage
+TODAY_ORD = date.today().toordinal()
+
+@lru_cache(maxsize=None)
+def year_span(start_year, end_year):
+    start = date(start_year, 1, 1).toordinal()
+    return start, date(end_year, 12, 31).toordinal() - start
+
+def iso_date(ordinal):
+    return None if ordinal is None else date.fromordinal(ordinal).isoformat()
+
+def rand_date(rnd, start_year=2021, end_year=2024):
+    start, delta = year_span(start_year, end_year)
+    return iso_date(start + rnd.randint(0, delta))
+
+def rand_order_ordinal(rnd):
+    start, delta = year_span(2021, 2024)
+    return start + rnd.randint(0, delta)
+
+# shipment 0-10 days after order, sometimes delayed (up to 20 days), sometimes missing
+SHIPMENT_DELAYS = [(0, 10), (11, 20), None]
+SHIPMENT_DELAY_CUM_WEIGHTS = [0.8, 0.95, 1.0]  # precomputed from weights 0.8/0.15/0.05
+
+def rand_shipment_ordinal(rnd, order_ordinal):
+    if order_ordinal is None:
         return None
-    od = datetime.fromisoformat(order_date_iso)
-    add = random.choices([random.randint(0,10), random.randint(11,20), None], weights=[0.8,0.15,0.05])[0]
-    if add is None:
+    delay = rnd.choices(SHIPMENT_DELAYS, cum_weights=SHIPMENT_DELAY_CUM_WEIGHTS)[0]
+    if delay is None:
         return None
-    return (od + timedelta(days=add)).date().isoformat()
+    return order_ordinal + rnd.randint(*delay)
+
+# Helper insert function
+def chunked_insert(cur, sql_prefix, cols, rows, batch=500):
+    # one multi-row INSERT ... VALUES (...),(...) per chunk instead of one statement run per row
+    # Keep each chunk within the bound-parameter limit (999 on SQLite builds before 3.32;
+    # Connection.getlimit needs Python 3.11+)
+    if hasattr(cur.connection, "getlimit"):
+        max_vars = cur.connection.getlimit(sqlite3.SQLITE_LIMIT_VARIABLE_NUMBER)
+    else:
+        max_vars = 999
+    batch = max(1, min(batch, max_vars // cols))
+    row_placeholders = "(" + ",".join(["?"] * cols) + ")"
+    for i in range(0, len(rows), batch):
+        chunk = rows[i:i+batch]
+        cur.execute(sql_prefix + ",".join([row_placeholders] * len(chunk)), [v for r in chunk for v in r])
 
 # Data Generation Parameters 
 NUM_CUSTOMERS = 1000
@@ -64,15 +105,149 @@ TIERS = ["Bronze", "Silver", "Gold", "Platinum"]  # Bronze < Silver < Gold < Pla
 # Genders (nominal)
 GENDERS = ["Male", "Female", "Non-binary", "Prefer not to say"]
 
+# Address pools for templated contact fields (cheaper than Faker's address/phone providers)
+STREETS = ["Main St", "Oak Ave", "Maple Dr", "Cedar Ln", "Pine St", "Elm St", "Lake Rd",
+           "Hill St", "Park Ave", "River Rd", "Church St", "Mill Rd", "Sunset Blvd", "Forest Dr"]
+CITIES = ["Springfield", "Riverside", "Franklin", "Greenville", "Fairview", "Madison", "Clinton",
+          "Georgetown", "Salem", "Bristol", "Arlington", "Ashland", "Dover", "Oxford"]
+STATES = ["AL", "AZ", "CA", "CO", "FL", "GA", "IL", "MA", "MI", "NC", "NJ", "NY", "OH", "PA",
+          "TX", "VA", "WA", "WI"]
+
+# Honorifics Faker puts before some names; skipped when deriving the email prefix
+NAME_PREFIXES = {"Mr.", "Mrs.", "Ms.", "Miss", "Dr."}
+
+#  Data generators (run in worker threads)
+def generate_products():
+    _, rng = make_rngs(0)
+    fake = make_fake(0)
+    # numeric/categorical columns drawn whole with NumPy, only the name word comes from Faker
+    cat_ids = rng.integers(1, NUM_CATEGORIES+1, NUM_PRODUCTS).tolist()
+    suffixes = rng.choice(['Pro','X','Plus','Mini','Max','Series'], NUM_PRODUCTS).tolist()
+    model_nos = rng.integers(100, 1000, NUM_PRODUCTS).tolist()
+    prices = np.round(rng.uniform(PRICE_MIN, PRICE_MAX, NUM_PRODUCTS), 2).tolist()
+    stocks = rng.integers(0, 501, NUM_PRODUCTS).tolist()
+
+    words = [fake.word().capitalize() for _ in range(NUM_PRODUCTS)]
+
+    products = [None] * NUM_PRODUCTS
+    for pid, word, cat_id, suffix, model_no, price, stock in zip(range(1, NUM_PRODUCTS+1), words, cat_ids, suffixes, model_nos, prices, stocks):
+        pname = f"{word} {suffix} {model_no}"
+        products[pid-1] = (pid, pname, cat_id, price, stock)
+    return products
+
+def generate_customer_columns():
+    # Generated column by column; rows are assembled as tuples once total_spent is known
+    rnd, rng = make_rngs(1)
+    fake = make_fake(1)
+    names = [fake.name() for _ in range(NUM_CUSTOMERS)]
+    first_names = [next(t for t in name.split() if t not in NAME_PREFIXES) for name in names]
+    emails = [f"{first.lower()}{rnd.randint(1,999)}@example.com" for first in first_names]
+    phones = [f"{rnd.randint(200,999)}-{rnd.randint(200,999)}-{rnd.randint(1000,9999)}" for _ in range(NUM_CUSTOMERS)]
+    addresses = [
+        f"{rnd.randint(1,9999)} {rnd.choice(STREETS)}, {rnd.choice(CITIES)}, {rnd.choice(STATES)} {rnd.randint(10000,99999)}"
+        for _ in range(NUM_CUSTOMERS)
+    ]
+
+    tiers = rng.choice(TIERS, NUM_CUSTOMERS, p=[0.5,0.3,0.15,0.05]).tolist()
+    genders = [rnd.choice(GENDERS) for _ in range(NUM_CUSTOMERS)]
+    # date of birth 18-70 years before today
+    dobs = [iso_date(d) for d in (TODAY_ORD - rng.integers(18*365, 70*365, NUM_CUSTOMERS, endpoint=True)).tolist()]
+    reg_dates = [rand_date(rnd, 2018, 2024) for _ in range(NUM_CUSTOMERS)]
+
+    # Keeping 2% missing contact info
+    num_missing = int(0.02 * NUM_CUSTOMERS)
+    for idx in rnd.sample(range(NUM_CUSTOMERS), num_missing):
+        rnd.choice([emails, phones, addresses])[idx] = None
+
+    # Keeping 1% duplicate names/emails
+    num_dup = int(0.01 * NUM_CUSTOMERS)
+    for idx in rnd.sample(range(NUM_CUSTOMERS), num_dup):
+        src = rnd.randrange(NUM_CUSTOMERS)
+        names[idx] = names[src]  # duplicate name
+        if rnd.random() < 0.5:
+            emails[idx] = emails[src]  # duplicate email
+    return names, genders, dobs, emails, phones, addresses, tiers, reg_dates
+
+def generate_orders_bundle(prod_ids, prod_prices):
+    # Orders, their items and shipments, plus per-customer order totals
+    rnd, rng = make_rngs(2)
+    # Pre-draw per-order and per-item columns with NumPy
+    cust_arr = rng.integers(1, NUM_CUSTOMERS+1, NUM_ORDERS).tolist()
+    promo_arr = rng.choice([None, "NEW10", "FREESHIP", "SUMMER20", None, None], NUM_ORDERS).tolist()
+    # choose 1-4 items per order
+    n_items_arr = rng.choice([1,2,3,4], NUM_ORDERS, p=[0.6,0.25,0.1,0.05])
+    n_total_items = int(n_items_arr.sum())
+    qty_arr = rng.integers(1, 6, n_total_items).tolist()
+    discount_arr = rng.choice([0,0,0.05,0.1], n_total_items).tolist()  # occasional discount
+    prod_idx_arr = rng.integers(0, NUM_PRODUCTS, n_total_items).tolist()
+    num_order_dupes = max(1, int(0.01 * NUM_ORDERS))
+
+    # Orders and items are pre-sized (each duplicate-like order has one item); shipment count is random
+    orders = [None] * (NUM_ORDERS + num_order_dupes)
+    order_items = [None] * (n_total_items + num_order_dupes)
+    order_ords = [None] * len(orders)  # order dates as ordinals, reused for shipment dates
+    totals = {}  # customer_id -> sum of order_total, becomes Customers.total_spent
+    shipments = []
+    order_id_seq = 1
+    item_idx = 0
+    for cust, promo, n_items in zip(cust_arr, promo_arr, n_items_arr.tolist()):
+        order_ord = rand_order_ordinal(rnd)
+        order_date = iso_date(order_ord)
+        item_no = 1
+        order_total = 0.0
+        for _ in range(n_items):
+            prod_idx = prod_idx_arr[item_idx]
+            pid = prod_ids[prod_idx]
+            unit_price = prod_prices[prod_idx]
+            qty = qty_arr[item_idx]
+            line_total = round(unit_price * qty * (1 - discount_arr[item_idx]), 2)
+            order_items[item_idx] = (order_id_seq, item_no, pid, qty, unit_price, line_total)
+            item_idx += 1
+            order_total += line_total
+            item_no += 1
+        # Round order_total:
+        order_total = round(order_total, 2)
+        orders[order_id_seq-1] = (order_id_seq, cust, order_date, order_total, promo)
+        totals[cust] = totals.get(cust, 0.0) + order_total
+        order_ords[order_id_seq-1] = order_ord
+        # 80% of orders have shipment record, shipment date sometimes missing (delayed)
+        if rnd.random() < 0.8:
+            shipped = rand_shipment_ordinal(rnd, order_ord)
+            delivered = rand_shipment_ordinal(rnd, shipped) if shipped is not None else None
+            shipments.append((None, order_id_seq, iso_date(shipped), iso_date(delivered), rnd.choice(["DHL","FedEx","UPS","Local"]), f"TRACK-{rnd.randint(0,99999):05d}"))
+        order_id_seq += 1
+
+    # Add ~1% duplicate-like orders (same cust/order_date but new order_id)
+    for _ in range(num_order_dupes):
+        src_idx = rnd.randrange(order_id_seq-1)
+        row = orders[src_idx]
+        cust = row[1]
+        order_date = row[2]
+        order_ord = order_ords[src_idx]
+        promo = row[4]
+        # small order
+        prod_idx = rnd.randrange(NUM_PRODUCTS)
+        pid = prod_ids[prod_idx]
+        unit_price = prod_prices[prod_idx]
+        qty = 1
+        line_total = round(unit_price * qty, 2)
+        orders[order_id_seq-1] = (order_id_seq, cust, order_date, line_total, promo)
+        totals[cust] = totals.get(cust, 0.0) + line_total
+        order_ords[order_id_seq-1] = order_ord
+        order_items[item_idx] = (order_id_seq, 1, pid, qty, unit_price, line_total)
+        item_idx += 1
+        if rnd.random() < 0.8:
+            shipped = rand_shipment_ordinal(rnd, order_ord)
+            delivered = rand_shipment_ordinal(rnd, shipped) if shipped is not None else None
+            shipments.append((None, order_id_seq, iso_date(shipped), iso_date(delivered), rnd.choice(["DHL","FedEx","UPS","Local"]), f"TRACK-{rnd.randint(0,99999):05d}"))
+        order_id_seq += 1
+    return orders, order_items, shipments, totals
+
 #  Create DB and Schema 
 DB_FILENAME = "ecommerce.db"
-conn = sqlite3.connect(DB_FILENAME)
-cur = conn.cursor()
-cur.execute("PRAGMA foreign_keys = ON;")
-
 
-# Create schema
-cur.executescript("""
+# Schema (module level so the DDL text stored in sqlite_master stays unindented)
+SCHEMA_SQL = """
 CREATE TABLE Categories (
     category_id INTEGER PRIMARY KEY,
     category_name TEXT NOT NULL
@@ -119,7 +294,7 @@ CREATE TABLE Order_Items (
     PRIMARY KEY(order_id, item_no), -- composite PK
     FOREIGN KEY(order_id) REFERENCES Orders(order_id) ON DELETE CASCADE,
     FOREIGN KEY(product_id) REFERENCES Products(product_id) ON DELETE RESTRICT
-);
+) WITHOUT ROWID; -- rows stored directly in the composite PK b-tree
 
 CREATE TABLE Shipments (
     shipment_id INTEGER PRIMARY KEY,
@@ -130,158 +305,102 @@ CREATE TABLE Shipments (
     tracking_number TEXT,
     FOREIGN KEY(order_id) REFERENCES Orders(order_id) ON DELETE CASCADE
 );
-""")
-conn.commit()
-
-#  Populate Categories 
-categories = [
-    "Electronics","Clothing","Home & Kitchen","Books","Toys","Sports",
-    "Beauty","Groceries","Automotive","Office","Garden","Health"
-]
-cur.executemany("INSERT INTO Categories (category_id, category_name) VALUES (?,?)",
-                [(i+1, categories[i]) for i in range(len(categories))])
-conn.commit()
-
-#  Populate Products 
-products = []
-for pid in range(1, NUM_PRODUCTS+1):
-    cat_id = random.randint(1, NUM_CATEGORIES)
-    pname = f"{fake.word().capitalize()} {random.choice(['Pro','X','Plus','Mini','Max','Series'])} {random.randint(100,999)}"
-    price = round(random.uniform(PRICE_MIN, PRICE_MAX), 2)
-    stock = random.randint(0, 500)
-    products.append((pid, pname, cat_id, price, stock))
-
-cur.executemany(
-    "INSERT INTO Products (product_id, product_name, category_id, price, stock) VALUES (?,?,?,?,?)",
-    products
-)
-conn.commit()
-
-#  Populate Customers (1000 rows) 
-customers = []
-for cid in range(1, NUM_CUSTOMERS+1):
-    name = fake.name()
-    gender = random.choice(GENDERS)
-    dob = (datetime.now() - timedelta(days=random.randint(18*365, 70*365))).date().isoformat()
-    email = fake.email()
-    phone = fake.phone_number()
-    address = fake.address().replace("\n", ", ")
-    tier = random.choices(TIERS, weights=[0.5,0.3,0.15,0.05])[0]
-    reg_date = rand_date(2018, 2024)
-    total_spent = 0.0
-    customers.append([cid, name, gender, dob, email, phone, address, tier, reg_date, total_spent])
-
-# Keeping 2% missing contact info
-num_missing = int(0.02 * len(customers))
-for idx in random.sample(range(len(customers)), num_missing):
-    col = random.choice([4,5,6])  # email index 4, phone index 5, address index 6 (0-based in list)
-    customers[idx][col] = None
-
-# Keeping 1% duplicate names/emails
-num_dup = int(0.01 * len(customers))
-dup_indices = random.sample(range(len(customers)), num_dup)
-for idx in dup_indices:
-    src = random.choice(customers)
-    customers[idx][1] = src[1]  # duplicate name
-    if random.random() < 0.5:
-        customers[idx][4] = src[4]  # duplicate email
-
-cur.executemany("""
-INSERT INTO Customers (customer_id, customer_name, gender, date_of_birth, email, phone_number, address, customer_tier, registration_date, total_spent)
-VALUES (?,?,?,?,?,?,?,?,?,?)
-""", customers)
-conn.commit()
-
-#  Populate Orders (~1400 rows) 
-orders = []
-order_items = []
-shipments = []
-order_id_seq = 1
-for _ in range(NUM_ORDERS):
-    cust = random.randint(1, NUM_CUSTOMERS)
-    order_date = rand_order_date()
-    promo = random.choice([None, "NEW10", "FREESHIP", "SUMMER20", None, None])
-    # choose 1-4 items per order
-    n_items = random.choices([1,2,3,4], weights=[0.6,0.25,0.1,0.05])[0]
-    item_no = 1
-    order_total = 0.0
-    for _ in range(n_items):
-        prod = random.choice(products)  # (pid, name, cat, price, stock)
-        pid = prod[0]
-        unit_price = prod[3]
-        qty = random.randint(1,5)
-        line_total = round(unit_price * qty * (1 - random.choice([0,0,0.05,0.1])), 2)  # occasional discount
-        order_items.append((order_id_seq, item_no, pid, qty, unit_price, line_total))
-        order_total += line_total
-        item_no += 1
-    # Round order_total:
-    order_total = round(order_total, 2)
-    orders.append((order_id_seq, cust, order_date, order_total, promo))
-    # 80% of orders have shipment record, shipment date sometimes missing (delayed)
-    if random.random() < 0.8:
-        shipped = rand_shipment_date(order_date)
-        delivered = rand_shipment_date(shipped) if shipped is not None else None
-        shipments.append((None, order_id_seq, shipped, delivered, random.choice(["DHL","FedEx","UPS","Local"]), fake.bothify(text='TRACK-#####')))
-    order_id_seq += 1
-
-# Add ~1% duplicate-like orders (same cust/order_date but new order_id)
-num_order_dupes = max(1, int(0.01 * len(orders)))
-for _ in range(num_order_dupes):
-    row = random.choice(orders)
-    cust = row[1]
-    order_date = row[2]
-    promo = row[4]
-    # small order
-    prod = random.choice(products)
-    unit_price = prod[3]
-    qty = 1
-    line_total = round(unit_price * qty, 2)
-    orders.append((order_id_seq, cust, order_date, line_total, promo))
-    order_items.append((order_id_seq, 1, prod[0], qty, unit_price, line_total))
-    if random.random() < 0.8:
-        shipped = rand_shipment_date(order_date)
-        delivered = rand_shipment_date(shipped) if shipped is not None else None
-        shipments.append((None, order_id_seq, shipped, delivered, random.choice(["DHL","FedEx","UPS","Local"]), fake.bothify(text='TRACK-#####')))
-    order_id_seq += 1
-
-# Bulk insert Orders
-cur.executemany("INSERT INTO Orders (order_id, customer_id, order_date, order_total, promo_code) VALUES (?,?,?,?,?)", orders)
-conn.commit()
-
-# Bulk insert Order_Items (composite PK order_id, item_no)
-cur.executemany("INSERT INTO Order_Items (order_id, item_no, product_id, quantity, unit_price, line_total) VALUES (?,?,?,?,?,?)", order_items)
-conn.commit()
-
-# Bulk insert Shipments (shipment_id is auto)
-cur.executemany("INSERT INTO Shipments (shipment_id, order_id, shipped_date, delivery_date, carrier, tracking_number) VALUES (?,?,?,?,?,?)", shipments)
-conn.commit()
-
-#  Update Customers.total_spent (aggregate)
-# Compute total spent per customer from Orders and update Customers.total_spent
-cur.execute("""
-SELECT customer_id, SUM(order_total) FROM Orders GROUP BY customer_id
-""")
-cust_totals = cur.fetchall()
-cur.executemany("UPDATE Customers SET total_spent = ? WHERE customer_id = ?", [(round(total if total else 0,2), cid) for cid, total in cust_totals])
-conn.commit()
-
-#  Final Integrity Checks 
-# Enable foreign key check
-cur.execute("PRAGMA foreign_keys = ON;")
-
-
-# Summary print
-cur.execute("SELECT COUNT(*) FROM Customers")
-print("Customers:", cur.fetchone()[0])
-cur.execute("SELECT COUNT(*) FROM Products")
-print("Products:", cur.fetchone()[0])
-cur.execute("SELECT COUNT(*) FROM Orders")
-print("Orders:", cur.fetchone()[0])
-cur.execute("SELECT COUNT(*) FROM Order_Items")
-print("Order_Items:", cur.fetchone()[0])
-cur.execute("SELECT COUNT(*) FROM Shipments")
-print("Shipments:", cur.fetchone()[0])
-
-conn.close()
-print("Database generated:", DB_FILENAME)
+"""
+
 
+def main():
+    # Build in an in-memory staging DB; written to DB_FILENAME in one pass with VACUUM INTO at the end
+    conn = sqlite3.connect(":memory:", isolation_level=None)  # transactions managed explicitly
+    cur = conn.cursor()
+    # Foreign keys stay off during the bulk load; validated with foreign_key_check afterwards
+    cur.execute("PRAGMA foreign_keys = OFF;")
+
+
+    # Create schema
+    cur.executescript(SCHEMA_SQL)
+
+    # Generation runs in worker threads; every SQLite call stays on this thread.
+    # Products are needed by the order generator, so orders are submitted once products are done
+    # and are generated while Categories/Products are being inserted.
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        products_future = pool.submit(generate_products)
+        customers_future = pool.submit(generate_customer_columns)
+
+        products = products_future.result()
+        # Flat product id/price lookups for order item sampling
+        prod_ids = [p[0] for p in products]
+        prod_prices = [p[3] for p in products]
+        orders_future = pool.submit(generate_orders_bundle, prod_ids, prod_prices)
+
+        # Populate every table inside one explicit transaction, committed once at the end
+        cur.execute("BEGIN")
+
+        #  Populate Categories 
+        # 12 fixed rows inlined as one statement: no parameter binding, single prepare
+        # (plain execute, since executescript would commit the open transaction)
+        cur.execute("""
+        INSERT INTO Categories (category_id, category_name) VALUES
+        (1,'Electronics'),(2,'Clothing'),(3,'Home & Kitchen'),(4,'Books'),(5,'Toys'),(6,'Sports'),
+        (7,'Beauty'),(8,'Groceries'),(9,'Automotive'),(10,'Office'),(11,'Garden'),(12,'Health')
+        """)
+
+        #  Populate Products 
+        chunked_insert(cur, "INSERT INTO Products (product_id, product_name, category_id, price, stock) VALUES ", 5, products)
+
+        names, genders, dobs, emails, phones, addresses, tiers, reg_dates = customers_future.result()
+        orders, order_items, shipments, totals = orders_future.result()
+
+    # Customers.total_spent from the generated orders (customers without orders keep 0)
+    customers = [
+        (cid, name, gender, dob, email, phone, address, tier, reg_date, round(totals.get(cid, 0.0), 2))
+        for cid, name, gender, dob, email, phone, address, tier, reg_date
+        in zip(range(1, NUM_CUSTOMERS+1), names, genders, dobs, emails, phones, addresses, tiers, reg_dates)
+    ]
+
+    # Bulk insert Customers
+    chunked_insert(cur, """
+    INSERT INTO Customers (customer_id, customer_name, gender, date_of_birth, email, phone_number, address, customer_tier, registration_date, total_spent)
+    VALUES """, 10, customers)
+
+    # Bulk insert Orders
+    chunked_insert(cur, "INSERT INTO Orders (order_id, customer_id, order_date, order_total, promo_code) VALUES ", 5, orders)
+
+    # Bulk insert Order_Items (composite PK order_id, item_no)
+    # Rows are generated in PK order, so the PK b-tree is only ever appended to during the load
+    chunked_insert(cur, "INSERT INTO Order_Items (order_id, item_no, product_id, quantity, unit_price, line_total) VALUES ", 6, order_items)
+
+    # Bulk insert Shipments (shipment_id is auto)
+    chunked_insert(cur, "INSERT INTO Shipments (shipment_id, order_id, shipped_date, delivery_date, carrier, tracking_number) VALUES ", 6, shipments)
+
+    # Validate referential integrity of the loaded rows
+    cur.execute("PRAGMA foreign_key_check")
+    violations = cur.fetchall()
+    if violations:
+        raise RuntimeError(f"foreign key violations after bulk load: {violations[:5]}")
+    cur.execute("COMMIT")
+
+    #  Final Integrity Checks 
+    # Enable foreign key check
+    cur.execute("PRAGMA foreign_keys = ON;")
+
+
+    # Summary print
+    cur.execute("SELECT COUNT(*) FROM Customers")
+    print("Customers:", cur.fetchone()[0])
+    cur.execute("SELECT COUNT(*) FROM Products")
+    print("Products:", cur.fetchone()[0])
+    cur.execute("SELECT COUNT(*) FROM Orders")
+    print("Orders:", cur.fetchone()[0])
+    cur.execute("SELECT COUNT(*) FROM Order_Items")
+    print("Order_Items:", cur.fetchone()[0])
+    cur.execute("SELECT COUNT(*) FROM Shipments")
+    print("Shipments:", cur.fetchone()[0])
+
+    # Materialize the staging DB to disk
+    cur.execute("VACUUM INTO ?", (DB_FILENAME,))
+    conn.close()
+    print("Database generated:", DB_FILENAME)
+
+
+if __name__ == "__main__":
+    main()